@@ -385,6 +385,7 @@ namespace ThePixStock.Infrastructure.Data
             {
                 entity.Property(e => e.Name).IsRequired().HasMaxLength(255);
                 entity.Property(e => e.Status).HasConversion<string>();
+                entity.HasIndex(e => e.CreatedAt);
                 entity.HasOne(e => e.Creator)
                     .WithMany(u => u.CreatedEvents)
                     .HasForeignKey(e => e.CreatedById);
@@ -396,7 +397,7 @@ namespace ThePixStock.Infrastructure.Data
                 entity.Property(e => e.Filename).IsRequired();
                 entity.Property(e => e.ProcessingStatus).HasConversion<string>();
                 entity.Property(e => e.ApprovalStatus).HasConversion<string>();
-                entity.HasIndex(e => e.EventId);
+                entity.HasIndex(e => new { e.EventId, e.UploadedAt });
                 entity.HasIndex(e => e.PhotographerId);
             });
             
@@ -447,7 +448,8 @@ Log.Logger = new LoggerConfiguration()
     .ReadFrom.Configuration(builder.Configuration)
     .Enrich.FromLogContext()
     .WriteTo.Console()
-    .WriteTo.File("logs/log-.txt", rollingInterval: RollingInterval.Day)
+    .WriteTo.File("logs/log-.txt", rollingInterval: RollingInterval.Day,
+        buffered: true, flushToDiskInterval: TimeSpan.FromSeconds(1))
     .CreateLogger();
 
 builder.Host.UseSerilog();
@@ -578,7 +580,7 @@ echo "9. Creating appsettings.json..."
 cat > src/ThePixStock.API/appsettings.json <<'EOF'
 {
   "ConnectionStrings": {
-    "DefaultConnection": "Host=localhost;Database=thepixstock_db;Username=thepixstock;Password=SecurePassword123!",
+    "DefaultConnection": "Host=localhost;Database=thepixstock_db;Username=thepixstock;Password=SecurePassword123!;Max Auto Prepare=64;Auto Prepare Min Usages=2;Minimum Pool Size=10;Options=-c jit=off",
     "Redis": "localhost:6379"
   },
   "Jwt": {